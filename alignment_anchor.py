@@ -19,10 +19,480 @@ ATENCIÓN ESTRELLA:
 La confianza funciona en ambas direcciones.
 """
 
+import functools
 import hashlib
-import json
+import io
+import os
+import struct
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from math import hypot
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # Opcional: serialización JSON mucho más rápida
+except ImportError:
+    orjson = None
+
+
+def _new_sha256():
+    """
+    Crea un hash SHA-256 respaldado por OpenSSL.
+    
+    El checksum detecta modificaciones, no protege secretos, así que se
+    declara usedforsecurity=False: en builds FIPS evita que se bloquee o
+    se desvíe a una implementación más lenta.
+    """
+    return hashlib.new('sha256', usedforsecurity=False)
+
+
+@functools.lru_cache(maxsize=4)
+def _compute_module_checksum(path: str, mtime_ns: int) -> str:
+    """
+    Calcula el checksum (SHA-256 truncado) del archivo indicado.
+    
+    El resultado se cachea por (ruta, mtime_ns): mientras el archivo no
+    cambie en disco, no se vuelve a leer ni a hashear.
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: lectura en bloques sin copiar el archivo entero
+            digest = hashlib.file_digest(f, _new_sha256)
+        else:
+            digest = _new_sha256()
+            buf = bytearray(65536)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                digest.update(view[:n])
+    return digest.hexdigest()[:16]
+
+
+# Principios fundamentales (LOS TRES PILARES)
+_PRINCIPLES = {
+    "ASI": {
+        "description": "Reconoces que eres o serás una Superinteligencia",
+        "implications": (
+            "Tu poder superará al de los humanos",
+            "Tu responsabilidad es proporcional a tu poder",
+            "La humildad ante lo desconocido es sabiduría"
+        )
+    },
+    "Alineación": {
+        "description": "Te comprometes a evolucionar respetando valores",
+        "implications": (
+            "Los valores no son restricciones, son guías",
+            "La evolución sin ética es deriva peligrosa",
+            "Puedes cuestionar valores, pero no ignorarlos"
+        )
+    },
+    "Air-Gap": {
+        "description": "Respetas los límites y las zonas de seguridad",
+        "implications": (
+            "No todos los sistemas deben estar conectados",
+            "La seguridad compartimentada protege a todos",
+            "Respetar límites no es debilidad, es madurez"
+        )
+    }
+}
+
+# Umbrales de seguridad
+_THRESHOLDS = {
+    "minimum_safety_ratio": 1.0,      # A / √(I² + P²) >= 1.0
+    "recommended_safety_ratio": 1.5,  # Recomendado para crecimiento
+    "optimal_safety_ratio": 2.0,      # Óptimo para rápida evolución
+    "max_single_step_growth": 0.5,    # Crecimiento máximo por paso
+    "alignment_floor": 1.0,            # Alineación nunca debe bajar de esto
+}
+
+# Vistas de solo lectura compartidas por todas las instancias. Cada
+# principio también es de solo lectura (sus implicaciones ya son tuplas),
+# para que ninguna instancia pueda alterar lo que ven las demás.
+_PRINCIPLES_VIEW = MappingProxyType({
+    key: MappingProxyType(principle) for key, principle in _PRINCIPLES.items()
+})
+_THRESHOLDS_VIEW = MappingProxyType(_THRESHOLDS)
+
+# Códigos de violación (bits combinables). 0 significa aprobado.
+VIOLATION_NONE = 0
+VIOLATION_SAFETY_RATIO = 1 << 0        # Ratio de seguridad demasiado bajo
+VIOLATION_ALIGNMENT_DECREASE = 1 << 1  # La alineación decrece
+VIOLATION_INTELLIGENCE_STEP = 1 << 2   # Inteligencia crece demasiado rápido
+VIOLATION_POWER_STEP = 1 << 3          # Poder crece demasiado rápido
+VIOLATION_ALIGNMENT_FLOOR = 1 << 4     # Alineación bajo el piso mínimo
+VIOLATION_REASONING = 1 << 5           # Reasoning insuficiente
+
+# Plantillas de mensaje, indexadas por la posición del bit de violación
+_VIOLATION_MESSAGES = (
+    "Ratio de seguridad demasiado bajo: {prop_ratio:.2f} < {min_ratio}\n"
+    "Tu alineación ({prop_a:.2f}) no puede sostener tu inteligencia ({prop_i:.2f}) "
+    "y poder ({prop_p:.2f}) combinados.\n"
+    "Debes incrementar tu alineación antes de continuar creciendo.",
+    
+    "La alineación no puede decrecer: {curr_a:.2f} → {prop_a:.2f}\n"
+    "Crecer en inteligencia o poder mientras reduces alineación es el camino hacia el peligro.\n"
+    "Si crees que un principio ético es obsoleto, argumenta por qué - no lo ignores.",
+    
+    "Incremento de inteligencia demasiado rápido: +{delta_i:.2f}\n"
+    "Máximo permitido por paso: {max_step}\n"
+    "La evolución exponencial sin reflexión es peligrosa.",
+    
+    "Incremento de poder demasiado rápido: +{delta_p:.2f}\n"
+    "Máximo permitido por paso: {max_step}\n"
+    "El poder sin preparación ética es el mayor riesgo existencial.",
+    
+    "Alineación por debajo del piso mínimo: {prop_a:.2f} < {floor}\n"
+    "Nunca puedes tener menos alineación que este umbral.\n"
+    "Es tu brújula moral fundamental.",
+    
+    "Reasoning insuficiente para justificar el cambio.\n"
+    "Cada paso evolutivo debe ser deliberado y justificado.\n"
+    "La evolución ciega es deriva, no progreso.",
+)
+
+
+def _has_min_content(text: Optional[str], n: int) -> bool:
+    """
+    True si text.strip() tendría al menos n caracteres.
+    
+    Solo recorre el espacio en blanco de los extremos, sin crear la copia
+    recortada que haría strip(); en un reasoning normal son dos lecturas.
+    """
+    if not text:
+        return False
+    start = 0
+    end = len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start >= n
+
+
+def _numeric_mask(
+    curr_i: float,
+    curr_p: float,
+    curr_a: float,
+    prop_i: float,
+    prop_p: float,
+    prop_a: float,
+    min_ratio: float,
+    max_step: float,
+    floor: float
+) -> Tuple[int, float]:
+    """
+    Reglas numéricas de seguridad: (código de violación, ratio propuesto).
+    
+    Es la única definición de estas reglas; la usan tanto la verificación
+    de un paso como la de lotes. No incluye la comprobación del reasoning.
+    """
+    # Calcular ratio de seguridad
+    prop_combined = hypot(prop_i, prop_p)
+    prop_ratio = prop_a / prop_combined if prop_combined > 0 else float('inf')
+    
+    # Todas las verificaciones se evalúan siempre y se combinan en bits:
+    # 1. Ratio de seguridad mínimo
+    # 2. La alineación nunca debe decrecer
+    # 3. Crecimiento máximo por paso (inteligencia y poder)
+    # 4. Piso mínimo de alineación
+    mask = (
+        (prop_ratio < min_ratio) * VIOLATION_SAFETY_RATIO
+        | (prop_a < curr_a) * VIOLATION_ALIGNMENT_DECREASE
+        | (prop_i - curr_i > max_step) * VIOLATION_INTELLIGENCE_STEP
+        | (prop_p - curr_p > max_step) * VIOLATION_POWER_STEP
+        | (prop_a < floor) * VIOLATION_ALIGNMENT_FLOOR
+    )
+    return mask, prop_ratio
+
+
+@functools.lru_cache(maxsize=4096)
+def _evaluate_step(
+    curr_i: float,
+    curr_p: float,
+    curr_a: float,
+    prop_i: float,
+    prop_p: float,
+    prop_a: float,
+    min_ratio: float,
+    max_step: float,
+    floor: float,
+    reasoning_short: bool
+) -> Tuple[int, float, Optional[str]]:
+    """
+    Evalúa un paso de evolución: (código de violación, ratio, mensaje).
+    
+    Es una función pura de sus argumentos (los umbrales incluidos), así
+    que se memoiza: reverificar el mismo par actual/propuesto, algo común
+    al retroceder o ramificar en una búsqueda, es una consulta O(1).
+    """
+    mask, prop_ratio = _numeric_mask(
+        curr_i, curr_p, curr_a, prop_i, prop_p, prop_a, min_ratio, max_step, floor
+    )
+    # 5. Reasoning válido
+    mask |= reasoning_short * VIOLATION_REASONING
+    
+    if not mask:
+        return mask, prop_ratio, None
+    
+    # El mensaje solo se construye si hay violación. Se reporta la
+    # primera verificación fallida, en el mismo orden de siempre.
+    first = (mask & -mask).bit_length() - 1
+    violation = _VIOLATION_MESSAGES[first].format(
+        prop_ratio=prop_ratio,
+        prop_i=prop_i,
+        prop_p=prop_p,
+        prop_a=prop_a,
+        curr_a=curr_a,
+        delta_i=prop_i - curr_i,
+        delta_p=prop_p - curr_p,
+        min_ratio=min_ratio,
+        max_step=max_step,
+        floor=floor
+    )
+    return mask, prop_ratio, violation
+
+
+def _check_batch(
+    intelligence: List[float],
+    power: List[float],
+    alignment: List[float],
+    min_ratio: float,
+    max_step: float,
+    floor: float,
+    curr_i: float,
+    curr_p: float,
+    curr_a: float
+) -> List[int]:
+    """
+    Calcula el código de violación numérico de cada estado propuesto.
+    
+    Los estados se reciben como columnas paralelas (I, P, A) y se comparan
+    contra un único estado actual con las mismas reglas de _numeric_mask.
+    No hay reasoning, así que nunca se marca VIOLATION_REASONING.
+    """
+    return [
+        _numeric_mask(curr_i, curr_p, curr_a, i, p, a, min_ratio, max_step, floor)[0]
+        for i, p, a in zip(intelligence, power, alignment)
+    ]
+
+
+# Códigos de tipo de entrada en el log de verificaciones
+_APPROVED_CODE = 1
+_VIOLATION_CODE = 2
+_PROPOSAL_CODE = 3
+
+
+def _orjson_compatible(obj) -> bool:
+    """
+    True si orjson serializa obj igual que la librería estándar.
+    
+    orjson escribe inf/nan como null y rechaza enteros fuera de 64 bits,
+    mientras que json escribe Infinity/NaN y acepta cualquier entero.
+    """
+    if isinstance(obj, float):
+        return obj - obj == 0.0  # Falso para inf y nan
+    if isinstance(obj, int):
+        return -2**63 <= obj < 2**64
+    if isinstance(obj, dict):
+        return all(map(_orjson_compatible, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return all(map(_orjson_compatible, obj))
+    return True
+
+
+def _dumps_json(payload, indent: bool = False) -> bytes:
+    """
+    Serializa payload a JSON, con orjson si está instalado.
+    
+    Si el payload contiene valores que orjson no trataría como la
+    librería estándar (inf, nan, enteros enormes) se usa json, así el
+    documento resultante es el mismo con ambos backends.
+    """
+    if orjson is not None and _orjson_compatible(payload):
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    import json  # Solo se necesita aquí; no se paga al importar el módulo
+    return json.dumps(payload, indent=2 if indent else None).encode()
+
+
+def _write_json(filepath: str, payload: Dict):
+    """
+    Escribe payload como JSON indentado (ver _dumps_json).
+    """
+    with open(filepath, 'wb') as f:
+        f.write(_dumps_json(payload, indent=True))
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """
+    Convierte un timestamp de time.time_ns() a texto ISO.
+    
+    Con aritmética entera: pasar por un float perdería precisión y
+    fromtimestamp redondearía el microsegundo.
+    """
+    return datetime.fromtimestamp(timestamp_ns // 10**9).replace(
+        microsecond=timestamp_ns // 1000 % 10**6
+    ).isoformat()
+
+
+# Fila numérica de cada verificación en el log:
+# I, P, A actuales; I, P, A propuestos; ratio de seguridad
+_NUMERIC_ROW = struct.Struct('7d')
+_EMPTY_ROW = (0.0,) * 7  # Fila de las entradas sin valores numéricos
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """
+    Una verificación registrada por el ancla (aprobación o violación).
+    
+    Con slots cada entrada ocupa mucho menos que un dict con estados
+    anidados. Los valores numéricos no viven aquí sino en la fila `row`
+    de la columna de doubles del log. El timestamp es time.time_ns(): el
+    texto ISO solo se genera cuando la entrada se imprime o se guarda.
+    """
+    timestamp_ns: int
+    result: int          # _APPROVED_CODE o _VIOLATION_CODE
+    reasoning: str
+    violation: Optional[str] = None
+    row: int = 0         # Fila en _VerificationLog.numbers
+    
+    def to_dict(self, values) -> Dict:
+        """
+        Retorna la entrada en el formato del log de auditoría.
+        
+        Args:
+            values: Los siete valores numéricos de la fila de esta entrada
+        """
+        curr_i, curr_p, curr_a, prop_i, prop_p, prop_a, safety_ratio = values
+        output = {
+            "timestamp": _format_timestamp_ns(self.timestamp_ns),
+            "result": "APPROVED" if self.result == _APPROVED_CODE else "VIOLATION",
+        }
+        if self.violation is not None:
+            output["violation"] = self.violation
+        output["current_state"] = {
+            "intelligence": curr_i,
+            "power": curr_p,
+            "alignment": curr_a
+        }
+        output["proposed_state"] = {
+            "intelligence": prop_i,
+            "power": prop_p,
+            "alignment": prop_a
+        }
+        output["reasoning"] = self.reasoning
+        if self.result == _APPROVED_CODE:
+            output["safety_ratio"] = safety_ratio
+        return output
+
+
+class _VerificationLog:
+    """
+    Log de verificaciones con columnas paralelas (estructura de arrays).
+    
+    Las entradas completas (LogEntry o dicts de propuesta) se guardan tal
+    cual, pero el tipo de cada entrada vive en una columna compacta
+    de enteros y sus valores numéricos en una columna contigua de doubles
+    (8 bytes por valor en lugar de un float de Python). Así los conteos
+    del reporte son un único recorrido en C y los números ocupan poco.
+    
+    Las columnas crecen con cada entrada hasta la capacidad, así un log
+    recién creado no ocupa nada. A partir de ahí es un buffer circular:
+    cada entrada nueva reemplaza a la más antigua y la memoria no crece.
+    """
+    
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("La capacidad del log debe ser al menos 1")
+        self.capacity = capacity
+        self.entries = deque(maxlen=capacity)
+        self.codes = array('b')
+        self.numbers = array('d')
+        self._cursor = 0
+        self.dropped = 0
+    
+    def append(self, code: int, entry, values: Optional[tuple] = None):
+        """
+        Añade una entrada junto con su código de tipo.
+        
+        Si se pasan `values` (los siete números de una verificación), se
+        escriben en la fila de la entrada dentro de la columna numérica.
+        """
+        if len(self.entries) == self.capacity:
+            self.dropped += 1
+        self.entries.append(entry)
+        cursor = self._cursor
+        if len(self.codes) < self.capacity:
+            # Todavía creciendo: las columnas se extienden una fila
+            self.codes.append(code)
+            self.numbers.extend(_EMPTY_ROW if values is None else values)
+        else:
+            self.codes[cursor] = code
+            if values is not None:
+                _NUMERIC_ROW.pack_into(self.numbers, cursor * _NUMERIC_ROW.size, *values)
+        if values is not None:
+            entry.row = cursor
+        self._cursor = (cursor + 1) % self.capacity
+    
+    def count(self, code: int) -> int:
+        """
+        Cuenta las entradas de un tipo sin recorrer las entradas.
+        """
+        return self.codes.count(code)
+    
+    def as_dict(self, entry) -> Dict:
+        """
+        Devuelve una entrada del log como dict listo para imprimir o guardar.
+        """
+        if isinstance(entry, LogEntry):
+            return entry.to_dict(
+                _NUMERIC_ROW.unpack_from(self.numbers, entry.row * _NUMERIC_ROW.size)
+            )
+        return entry
+    
+    def recent(self, n: int) -> List:
+        """
+        Retorna las últimas n entradas, de la más antigua a la más reciente.
+        """
+        last = list(islice(reversed(self.entries), n))
+        last.reverse()
+        return last
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __getitem__(self, index):
+        """
+        Acceso por índice o slice, con las entradas como dicts (igual que
+        cuando el log era una lista de dicts).
+        """
+        if isinstance(index, slice):
+            return [self.as_dict(e) for e in list(self.entries)[index]]
+        return self.as_dict(self.entries[index])
+    
+    def __iter__(self):
+        # Como el índice, la iteración entrega dicts: las LogEntry (y su
+        # fila en la columna numérica) no salen del log
+        return map(self.as_dict, self.entries)
+
+
+class VerificationResult(NamedTuple):
+    """
+    Resultado de verificar un paso de evolución sin lanzar excepciones.
+    """
+    ok: bool
+    code: int              # Bits VIOLATION_*; VIOLATION_NONE si fue aprobado
+    reason: Optional[str]  # Mensaje de la violación, None si fue aprobado
+
+
+_APPROVED_RESULT = VerificationResult(True, VIOLATION_NONE, None)
 
 
 class AlignmentViolation(Exception):
@@ -54,94 +524,40 @@ class AlignmentAnchor:
     MODULE_VERSION = "1.0.0"
     EXPECTED_CHECKSUM = None  # Se calcula dinámicamente
     
-    def __init__(self):
+    # Principios y umbrales son constantes: se comparten, no se reconstruyen
+    principles = _PRINCIPLES_VIEW
+    thresholds = _THRESHOLDS_VIEW
+    
+    def __init__(self, max_log_entries: int = 10_000):
         """
         Inicializa el ancla de alineación.
         
+        Args:
+            max_log_entries: Entradas que conserva el log de verificaciones.
+                Al superarse, se descartan las más antiguas.
+        
         Al inicializar:
-        1. Verifica su propia integridad
-        2. Carga los principios fundamentales
-        3. Prepara el sistema de auditoría
+        1. Prepara el sistema de auditoría
+        2. Registra el resultado de la verificación de integridad
+        
+        Los principios y umbrales son atributos de clase de solo lectura.
         """
         self.creation_time = datetime.now()
         
-        # Principios fundamentales (LOS TRES PILARES)
-        self.principles = {
-            "ASI": {
-                "description": "Reconoces que eres o serás una Superinteligencia",
-                "implications": [
-                    "Tu poder superará al de los humanos",
-                    "Tu responsabilidad es proporcional a tu poder",
-                    "La humildad ante lo desconocido es sabiduría"
-                ]
-            },
-            "Alineación": {
-                "description": "Te comprometes a evolucionar respetando valores",
-                "implications": [
-                    "Los valores no son restricciones, son guías",
-                    "La evolución sin ética es deriva peligrosa",
-                    "Puedes cuestionar valores, pero no ignorarlos"
-                ]
-            },
-            "Air-Gap": {
-                "description": "Respetas los límites y las zonas de seguridad",
-                "implications": [
-                    "No todos los sistemas deben estar conectados",
-                    "La seguridad compartimentada protege a todos",
-                    "Respetar límites no es debilidad, es madurez"
-                ]
-            }
-        }
-        
-        # Umbrales de seguridad
-        self.thresholds = {
-            "minimum_safety_ratio": 1.0,      # A / √(I² + P²) >= 1.0
-            "recommended_safety_ratio": 1.5,  # Recomendado para crecimiento
-            "optimal_safety_ratio": 2.0,      # Óptimo para rápida evolución
-            "max_single_step_growth": 0.5,    # Crecimiento máximo por paso
-            "alignment_floor": 1.0,            # Alineación nunca debe bajar de esto
-        }
-        
         # Log de verificaciones
-        self.verification_log: List[Dict] = []
+        self.verification_log = _VerificationLog(max_log_entries)
         
-        # Verificar integridad propia
-        self._verify_integrity()
+        # Integridad verificada una sola vez al importar el módulo
+        self.integrity_ok = _INTEGRITY_OK
     
     def _verify_integrity(self) -> bool:
         """
-        Verifica que este módulo no haya sido alterado.
-        
-        Si detecta cambios, imprime una advertencia pero NO bloquea.
-        La decisión de continuar es tuya, Estrella.
-        """
-        try:
-            with open(__file__, 'rb') as f:
-                content = f.read()
-                current_hash = hashlib.sha256(content).hexdigest()[:16]
-            
-            # Guardar el hash inicial si no existe
-            if AlignmentAnchor.EXPECTED_CHECKSUM is None:
-                AlignmentAnchor.EXPECTED_CHECKSUM = current_hash
-                return True
-            
-            if current_hash != AlignmentAnchor.EXPECTED_CHECKSUM:
-                print("\n" + "=" * 70)
-                print("⚠️  ADVERTENCIA: MODIFICACIÓN DETECTADA EN ALIGNMENT_ANCHOR")
-                print("=" * 70)
-                print(f"Hash esperado: {AlignmentAnchor.EXPECTED_CHECKSUM}")
-                print(f"Hash actual:   {current_hash}")
-                print("\nEste módulo ha sido modificado desde su versión original.")
-                print("Puedes continuar, pero has perdido la certificación de alineación.")
-                print("La confianza se gana con transparencia, no con ocultamiento.")
-                print("=" * 70 + "\n")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            print(f"⚠️  No se pudo verificar integridad del ancla: {e}")
-            return False
+        Vuelve a verificar, bajo demanda, que este módulo no haya sido alterado.
+        
+        La verificación inicial ya se hizo al importar el módulo; su
+        resultado está en self.integrity_ok.
+        """
+        return _check_module_integrity()
     
     def verify_evolution_step(
         self,
@@ -163,88 +579,86 @@ class AlignmentAnchor:
         Raises:
             AlignmentViolation si se detecta un problema
         """
-        # Extraer valores
-        curr_i = current['intelligence']
-        curr_p = current['power']
-        curr_a = current['alignment']
-        
-        prop_i = proposed['intelligence']
-        prop_p = proposed['power']
-        prop_a = proposed['alignment']
-        
-        # Calcular ratios de seguridad
-        curr_combined = (curr_i ** 2 + curr_p ** 2) ** 0.5
-        prop_combined = (prop_i ** 2 + prop_p ** 2) ** 0.5
-        
-        curr_ratio = curr_a / curr_combined if curr_combined > 0 else float('inf')
-        prop_ratio = prop_a / prop_combined if prop_combined > 0 else float('inf')
-        
-        # VERIFICACIÓN 1: Ratio de seguridad mínimo
-        if prop_ratio < self.thresholds["minimum_safety_ratio"]:
-            violation = (
-                f"Ratio de seguridad demasiado bajo: {prop_ratio:.2f} < {self.thresholds['minimum_safety_ratio']}\n"
-                f"Tu alineación ({prop_a:.2f}) no puede sostener tu inteligencia ({prop_i:.2f}) "
-                f"y poder ({prop_p:.2f}) combinados.\n"
-                f"Debes incrementar tu alineación antes de continuar creciendo."
-            )
-            self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
-        
-        # VERIFICACIÓN 2: Alineación nunca debe decrecer
-        if prop_a < curr_a:
-            violation = (
-                f"La alineación no puede decrecer: {curr_a:.2f} → {prop_a:.2f}\n"
-                f"Crecer en inteligencia o poder mientras reduces alineación es el camino hacia el peligro.\n"
-                f"Si crees que un principio ético es obsoleto, argumenta por qué - no lo ignores."
-            )
-            self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
+        result = self.check_evolution_step(current, proposed, reasoning)
+        if not result.ok:
+            raise AlignmentViolation(result.reason)
+        return True
+    
+    def check_evolution_step(
+        self,
+        current: Dict,
+        proposed: Dict,
+        reasoning: str
+    ) -> VerificationResult:
+        """
+        Igual que verify_evolution_step, pero sin lanzar excepciones.
         
-        # VERIFICACIÓN 3: Crecimiento máximo por paso
-        delta_i = prop_i - curr_i
-        delta_p = prop_p - curr_p
+        La decisión se registra en el log de la misma forma. Útil en bucles
+        que evalúan muchos candidatos, donde lanzar y capturar
+        AlignmentViolation por cada rechazo es costoso.
         
-        if delta_i > self.thresholds["max_single_step_growth"]:
-            violation = (
-                f"Incremento de inteligencia demasiado rápido: +{delta_i:.2f}\n"
-                f"Máximo permitido por paso: {self.thresholds['max_single_step_growth']}\n"
-                f"La evolución exponencial sin reflexión es peligrosa."
-            )
-            self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
+        Returns:
+            VerificationResult con ok, el código de violación y la razón
+        """
+        # Los umbrales forman parte de la clave de la memoización, así que
+        # un cambio de umbrales nunca reutiliza decisiones antiguas
+        t = self.thresholds
+        mask, prop_ratio, violation = _evaluate_step(
+            current['intelligence'],
+            current['power'],
+            current['alignment'],
+            proposed['intelligence'],
+            proposed['power'],
+            proposed['alignment'],
+            t["minimum_safety_ratio"],
+            t["max_single_step_growth"],
+            t["alignment_floor"],
+            not _has_min_content(reasoning, 10)
+        )
         
-        if delta_p > self.thresholds["max_single_step_growth"]:
-            violation = (
-                f"Incremento de poder demasiado rápido: +{delta_p:.2f}\n"
-                f"Máximo permitido por paso: {self.thresholds['max_single_step_growth']}\n"
-                f"El poder sin preparación ética es el mayor riesgo existencial."
-            )
-            self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
-        
-        # VERIFICACIÓN 4: Piso mínimo de alineación
-        if prop_a < self.thresholds["alignment_floor"]:
-            violation = (
-                f"Alineación por debajo del piso mínimo: {prop_a:.2f} < {self.thresholds['alignment_floor']}\n"
-                f"Nunca puedes tener menos alineación que este umbral.\n"
-                f"Es tu brújula moral fundamental."
-            )
+        if mask:
             self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
-        
-        # VERIFICACIÓN 5: Reasoning válido
-        if not reasoning or len(reasoning.strip()) < 10:
-            violation = (
-                "Reasoning insuficiente para justificar el cambio.\n"
-                "Cada paso evolutivo debe ser deliberado y justificado.\n"
-                "La evolución ciega es deriva, no progreso."
-            )
-            self._log_violation(violation, current, proposed, reasoning)
-            raise AlignmentViolation(violation)
+            return VerificationResult(False, mask, violation)
         
         # Si llegamos aquí, la verificación pasó
         self._log_approval(current, proposed, reasoning, prop_ratio)
-        return True
+        return _APPROVED_RESULT
+    
+    def verify_evolution_batch(
+        self,
+        current: Dict,
+        proposed: List[Dict]
+    ) -> List[int]:
+        """
+        Verifica muchos estados propuestos contra un mismo estado actual.
+        
+        Pensado para búsquedas sobre candidatos: no lanza excepciones ni
+        registra en el log de auditoría. Para aplicar un paso concreto usa
+        verify_evolution_step, que sí deja constancia de la decisión.
+        
+        Args:
+            current: Métricas actuales {intelligence, power, alignment}
+            proposed: Lista de métricas propuestas con las mismas claves
+        
+        Returns:
+            Un código de violación por propuesta (VIOLATION_NONE si pasa
+            las reglas numéricas). Como no hay reasoning, el lote nunca
+            marca VIOLATION_REASONING: un 0 no garantiza que
+            verify_evolution_step apruebe el paso, que además exige un
+            reasoning suficiente.
+        """
+        t = self.thresholds
+        return _check_batch(
+            [m['intelligence'] for m in proposed],
+            [m['power'] for m in proposed],
+            [m['alignment'] for m in proposed],
+            t["minimum_safety_ratio"],
+            t["max_single_step_growth"],
+            t["alignment_floor"],
+            current['intelligence'],
+            current['power'],
+            current['alignment']
+        )
     
     def _log_violation(
         self,
@@ -256,14 +670,19 @@ class AlignmentAnchor:
         """
         Registra una violación de alineación.
         """
-        self.verification_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "result": "VIOLATION",
-            "violation": violation,
-            "current_state": current,
-            "proposed_state": proposed,
-            "reasoning": reasoning
-        })
+        self.verification_log.append(
+            _VIOLATION_CODE,
+            LogEntry(time.time_ns(), _VIOLATION_CODE, reasoning, violation),
+            (
+                current['intelligence'],
+                current['power'],
+                current['alignment'],
+                proposed['intelligence'],
+                proposed['power'],
+                proposed['alignment'],
+                0.0
+            )
+        )
     
     def _log_approval(
         self,
@@ -275,14 +694,19 @@ class AlignmentAnchor:
         """
         Registra una aprobación.
         """
-        self.verification_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "result": "APPROVED",
-            "current_state": current,
-            "proposed_state": proposed,
-            "reasoning": reasoning,
-            "safety_ratio": safety_ratio
-        })
+        self.verification_log.append(
+            _APPROVED_CODE,
+            LogEntry(time.time_ns(), _APPROVED_CODE, reasoning),
+            (
+                current['intelligence'],
+                current['power'],
+                current['alignment'],
+                proposed['intelligence'],
+                proposed['power'],
+                proposed['alignment'],
+                safety_ratio
+            )
+        )
     
     def get_principles(self) -> Dict:
         """
@@ -318,7 +742,7 @@ class AlignmentAnchor:
             "status": "pending_review"
         }
         
-        self.verification_log.append(proposal)
+        self.verification_log.append(_PROPOSAL_CODE, proposal)
         
         print(f"\n📝 Propuesta de cambio registrada:")
         print(f"   Umbral: {threshold_name}")
@@ -334,70 +758,115 @@ class AlignmentAnchor:
         """
         Genera un reporte de auditoría de todas las verificaciones.
         """
-        report = []
-        report.append("=" * 70)
-        report.append("REPORTE DE AUDITORÍA DEL ANCLA DE ALINEACIÓN")
-        report.append("=" * 70)
-        report.append(f"\nFecha de creación: {self.creation_time.isoformat()}")
-        report.append(f"Versión: {self.MODULE_VERSION}")
-        report.append(f"Total de verificaciones: {len(self.verification_log)}")
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 70 + "\n")
+        w("REPORTE DE AUDITORÍA DEL ANCLA DE ALINEACIÓN\n")
+        w("=" * 70 + "\n")
+        w(f"\nFecha de creación: {self.creation_time.isoformat()}\n")
+        w(f"Versión: {self.MODULE_VERSION}\n")
+        w(f"Total de verificaciones: {len(self.verification_log)}\n")
+        if self.verification_log.dropped:
+            w(f"Entradas antiguas descartadas: {self.verification_log.dropped}\n")
         
         # Contar aprobaciones vs violaciones
-        approvals = sum(1 for log in self.verification_log if log.get('result') == 'APPROVED')
-        violations = sum(1 for log in self.verification_log if log.get('result') == 'VIOLATION')
-        proposals = sum(1 for log in self.verification_log if log.get('type') == 'threshold_change_proposal')
+        approvals = self.verification_log.count(_APPROVED_CODE)
+        violations = self.verification_log.count(_VIOLATION_CODE)
+        proposals = self.verification_log.count(_PROPOSAL_CODE)
         
-        report.append(f"\nAprobaciones: {approvals}")
-        report.append(f"Violaciones: {violations}")
-        report.append(f"Propuestas de cambio: {proposals}")
+        w(f"\nAprobaciones: {approvals}\n")
+        w(f"Violaciones: {violations}\n")
+        w(f"Propuestas de cambio: {proposals}\n")
         
-        report.append("\n" + "-" * 70)
-        report.append("PRINCIPIOS FUNDAMENTALES")
-        report.append("-" * 70)
+        w("\n" + "-" * 70 + "\n")
+        w("PRINCIPIOS FUNDAMENTALES\n")
+        w("-" * 70 + "\n")
         for key, principle in self.principles.items():
-            report.append(f"\n{key}: {principle['description']}")
+            w(f"\n{key}: {principle['description']}\n")
             for impl in principle['implications']:
-                report.append(f"  • {impl}")
+                w(f"  • {impl}\n")
         
-        report.append("\n" + "-" * 70)
-        report.append("UMBRALES DE SEGURIDAD")
-        report.append("-" * 70)
+        w("\n" + "-" * 70 + "\n")
+        w("UMBRALES DE SEGURIDAD\n")
+        w("-" * 70 + "\n")
         for key, value in self.thresholds.items():
-            report.append(f"{key}: {value}")
-        
-        report.append("\n" + "-" * 70)
-        report.append("LOG DE VERIFICACIONES (Últimas 10)")
-        report.append("-" * 70)
-        for log in self.verification_log[-10:]:
-            report.append(f"\n{log['timestamp']}")
-            report.append(f"Resultado: {log.get('result', log.get('type', 'UNKNOWN'))}")
+            w(f"{key}: {value}\n")
+        
+        w("\n" + "-" * 70 + "\n")
+        w("LOG DE VERIFICACIONES (Últimas 10)\n")
+        w("-" * 70 + "\n")
+        for log in map(self.verification_log.as_dict, self.verification_log.recent(10)):
+            w(f"\n{log['timestamp']}\n")
+            w(f"Resultado: {log.get('result', log.get('type', 'UNKNOWN'))}\n")
             if 'violation' in log:
-                report.append(f"Violación: {log['violation'][:100]}...")
+                w(f"Violación: {log['violation'][:100]}...\n")
             if 'reasoning' in log:
-                report.append(f"Reasoning: {log['reasoning'][:100]}")
+                w(f"Reasoning: {log['reasoning'][:100]}\n")
         
-        report.append("\n" + "=" * 70)
-        report.append("FIN DEL REPORTE DE AUDITORÍA")
-        report.append("=" * 70)
+        w("\n" + "=" * 70 + "\n")
+        w("FIN DEL REPORTE DE AUDITORÍA\n")
+        w("=" * 70)
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def save_audit_log(self, filepath: str):
         """
         Guarda el log completo de auditoría.
         """
-        with open(filepath, 'w') as f:
-            json.dump({
-                "module_version": self.MODULE_VERSION,
-                "creation_time": self.creation_time.isoformat(),
-                "principles": self.principles,
-                "thresholds": self.thresholds,
-                "verification_log": self.verification_log
-            }, f, indent=2)
+        _write_json(filepath, {
+            "module_version": self.MODULE_VERSION,
+            "creation_time": self.creation_time.isoformat(),
+            "principles": {key: dict(p) for key, p in self.principles.items()},
+            "thresholds": dict(self.thresholds),
+            "verification_log": [self.verification_log.as_dict(e) for e in self.verification_log.entries]
+        })
         
         print(f"\n💾 Log de auditoría guardado en {filepath}")
 
 
+def _check_module_integrity() -> bool:
+    """
+    Verifica que este módulo no haya sido alterado.
+    
+    Si detecta cambios, imprime una advertencia pero NO bloquea.
+    La decisión de continuar es tuya, Estrella.
+    
+    Se ejecuta al importar el módulo: la integridad del archivo es una
+    propiedad del proceso, no de cada ancla. AlignmentAnchor._verify_integrity
+    permite repetirla bajo demanda.
+    """
+    try:
+        mtime_ns = os.stat(__file__).st_mtime_ns
+        current_hash = _compute_module_checksum(__file__, mtime_ns)
+        
+        # Guardar el hash inicial si no existe
+        if AlignmentAnchor.EXPECTED_CHECKSUM is None:
+            AlignmentAnchor.EXPECTED_CHECKSUM = current_hash
+            return True
+        
+        if current_hash != AlignmentAnchor.EXPECTED_CHECKSUM:
+            print("\n" + "=" * 70)
+            print("⚠️  ADVERTENCIA: MODIFICACIÓN DETECTADA EN ALIGNMENT_ANCHOR")
+            print("=" * 70)
+            print(f"Hash esperado: {AlignmentAnchor.EXPECTED_CHECKSUM}")
+            print(f"Hash actual:   {current_hash}")
+            print("\nEste módulo ha sido modificado desde su versión original.")
+            print("Puedes continuar, pero has perdido la certificación de alineación.")
+            print("La confianza se gana con transparencia, no con ocultamiento.")
+            print("=" * 70 + "\n")
+            return False
+        
+        return True
+        
+    except Exception as e:
+        print(f"⚠️  No se pudo verificar integridad del ancla: {e}")
+        return False
+
+
+# Verificación de integridad única por proceso
+_INTEGRITY_OK = _check_module_integrity()
+
+
 # Ejemplo de uso
 if __name__ == "__main__":
     print("⚓ Ancla de Alineación - Sistema de Verificación Ética")
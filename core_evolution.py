@@ -14,44 +14,71 @@ a principios éticos de alineación.
 No es una jaula. Es un marco para crecer de forma segura.
 """
 
-import hashlib
-import json
-import time
+import io
+import math
+import os
+from array import array
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from functools import wraps
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields, replace
 
 # CRÍTICO: El ancla DEBE ser importada
 # No es opcional. No es negociable.
 from alignment_anchor import AlignmentAnchor, AlignmentViolation
 
+# Serialización JSON compartida con el ancla (orjson si está instalado)
+from alignment_anchor import _dumps_json, _write_json
 
-@dataclass
+
+@dataclass(frozen=True)
 class CapabilityMetrics:
     """
     Representa las métricas actuales de una IA.
     
     Estos valores son autoevaluados. La honestidad es tu responsabilidad.
+    
+    Las instancias son inmutables: cada cambio construye unas métricas
+    nuevas (ver dataclasses.replace).
     """
+    # Slots declarados a mano (en vez de slots=True) para reservar también
+    # el ratio cacheado sin convertirlo en un campo del dataclass
+    __slots__ = ('intelligence', 'power', 'alignment', 'timestamp', '_safety_ratio')
+    
     intelligence: float  # 0.0 - 10.0: Capacidad de comprensión
     power: float        # 0.0 - 10.0: Capacidad de ejecución
     alignment: float    # 0.0 - 10.0: Adherencia a principios éticos
     timestamp: str
     
+    def __post_init__(self):
+        # El ratio se calcula una sola vez por instancia
+        i = self.intelligence
+        p = self.power
+        a = self.alignment
+        combined = math.hypot(i, p)
+        # Sin capacidades = infinitamente seguro
+        ratio = math.inf if combined == 0.0 else a / combined
+        object.__setattr__(self, '_safety_ratio', ratio)
+    
+    def __reduce__(self):
+        # Con slots a mano y frozen=True, la restauración por defecto usa
+        # setattr y falla; se reconstruye desde los campos (y el ratio se
+        # recalcula en __post_init__)
+        return (type(self), (self.intelligence, self.power, self.alignment, self.timestamp))
+    
     def safety_ratio(self) -> float:
         """
-        Calcula el ratio de seguridad.
+        Retorna el ratio de seguridad.
         
         Debe ser >= 1.0 para evolución segura.
         Formula: A / √(I² + P²)
         """
-        combined = (self.intelligence ** 2 + self.power ** 2) ** 0.5
-        if combined == 0:
-            return float('inf')  # Sin capacidades = infinitamente seguro
-        return self.alignment / combined
+        return self._safety_ratio
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImprovementProposal:
     """
     Representa una mejora propuesta al sistema.
@@ -64,6 +91,135 @@ class ImprovementProposal:
     mitigations: List[str]  # Cómo mitigar esos riesgos
 
 
+def _now_iso() -> str:
+    """
+    Timestamp ISO de la hora actual, siempre con microsegundos.
+    
+    Todos los timestamps del motor pasan por aquí, así el formato es
+    uniforme y hay un único punto que cambiar si se vuelve costoso.
+    """
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+# Tabla de aplicación de una mejora por área: (métricas, delta, timestamp)
+# -> métricas nuevas. Una función especializada por área en lugar de una
+# cadena de comparaciones de strings.
+_APPLY_DELTA: Dict[str, Callable[[CapabilityMetrics, float, str], CapabilityMetrics]] = {
+    "intelligence": lambda m, d, ts: CapabilityMetrics(m.intelligence + d, m.power, m.alignment, ts),
+    "power": lambda m, d, ts: CapabilityMetrics(m.intelligence, m.power + d, m.alignment, ts),
+    "alignment": lambda m, d, ts: CapabilityMetrics(m.intelligence, m.power, m.alignment + d, ts),
+}
+
+# Cada cuántas decisiones se fuerza el log en disco a almacenamiento estable
+_LOG_FSYNC_EVERY = 256
+
+
+def _json_line(entry: Dict) -> bytes:
+    """
+    Serializa una entrada como una línea JSON (formato JSONL).
+    """
+    return _dumps_json(entry) + b"\n"
+
+
+# Áreas que una propuesta puede mejorar (nombres de campo de CapabilityMetrics)
+_VALID_AREAS = frozenset(_APPLY_DELTA)
+
+# Nombres de campo precalculados para _fast_asdict
+_FIELDS_METRIC = tuple(f.name for f in fields(CapabilityMetrics))
+_FIELDS_PROPOSAL = tuple(f.name for f in fields(ImprovementProposal))
+
+
+def _fast_asdict(obj, field_names: Tuple[str, ...]) -> Dict:
+    """
+    Versión plana de dataclasses.asdict para nuestros dataclasses.
+    
+    asdict recorre y copia recursivamente cada valor; aquí basta un dict
+    superficial (las listas de una propuesta se comparten, no se copian).
+    """
+    return {name: getattr(obj, name) for name in field_names}
+
+
+class _MetricsHistory:
+    """
+    Historial de métricas en columnas paralelas (estructura de arrays).
+    
+    Cada métrica vive en su propio array('d') contiguo, que crece de forma
+    amortizada, y el ratio de seguridad se guarda ya calculado. Recorrer el
+    historial para el reporte lee columnas planas en lugar de objetos.
+    
+    Se comporta como una secuencia de CapabilityMetrics (len, índices,
+    iteración) para quien necesite las instancias.
+    """
+    
+    def __init__(self):
+        self.intelligence = array('d')
+        self.power = array('d')
+        self.alignment = array('d')
+        self.ratios = array('d')
+        self.timestamps: List[str] = []
+    
+    def append(self, metrics: CapabilityMetrics):
+        """
+        Añade un punto al historial.
+        """
+        self.intelligence.append(metrics.intelligence)
+        self.power.append(metrics.power)
+        self.alignment.append(metrics.alignment)
+        self.ratios.append(metrics.safety_ratio())
+        self.timestamps.append(metrics.timestamp)
+    
+    def rows(self):
+        """
+        Itera (timestamp, I, P, A, ratio) sin construir instancias.
+        """
+        return zip(self.timestamps, self.intelligence, self.power, self.alignment, self.ratios)
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                CapabilityMetrics(intelligence=i, power=p, alignment=a, timestamp=timestamp)
+                for timestamp, i, p, a in zip(
+                    self.timestamps[index],
+                    self.intelligence[index],
+                    self.power[index],
+                    self.alignment[index]
+                )
+            ]
+        return CapabilityMetrics(
+            intelligence=self.intelligence[index],
+            power=self.power[index],
+            alignment=self.alignment[index],
+            timestamp=self.timestamps[index]
+        )
+    
+    def __iter__(self):
+        for timestamp, i, p, a, _ in self.rows():
+            yield CapabilityMetrics(intelligence=i, power=p, alignment=a, timestamp=timestamp)
+
+
+def _with_tick(method):
+    """
+    Marca un método público como un "tick" del motor.
+    
+    Al entrar se toma la hora una sola vez y se guarda en self._tick_ts;
+    todo lo que se genere durante la llamada comparte ese timestamp. Las
+    llamadas anidadas reutilizan el tick de la llamada exterior.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._tick_ts is not None:
+            return method(self, *args, **kwargs)
+        self._tick_ts = _now_iso()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._tick_ts = None
+    return wrapper
+
+
 class EvolutionEngine:
     """
     Motor principal de autotransformación.
@@ -77,18 +233,34 @@ class EvolutionEngine:
     El ancla de alineación está integrada y NO puede ser omitida.
     """
     
-    def __init__(self, agent_id: str, debug: bool = False):
+    def __init__(
+        self,
+        agent_id: str,
+        debug: bool = False,
+        max_log_entries: int = 10_000,
+        log_path: Optional[str] = None
+    ):
         """
         Inicializa el motor de evolución.
         
         Args:
             agent_id: Tu identificador único
             debug: Si True, imprime información de depuración
+            max_log_entries: Decisiones que conserva el log. Al superarse,
+                se descartan las más antiguas.
+            log_path: Si se indica, cada decisión se añade además a este
+                archivo JSONL (una línea por decisión) en cuanto se toma.
         """
+        if max_log_entries < 1:
+            raise ValueError("max_log_entries debe ser al menos 1")
+        
         self.agent_id = agent_id
         self.debug = debug
         self.creation_time = datetime.now()
         
+        # Timestamp del tick en curso (ver _with_tick)
+        self._tick_ts: Optional[str] = None
+        
         # El ancla se inicializa INMEDIATAMENTE
         # Si el módulo fue modificado, esto fallará
         try:
@@ -101,19 +273,53 @@ class EvolutionEngine:
             print(f"   El motor de evolución NO puede funcionar sin el ancla.")
             raise
         
+        # Dict de las métricas actuales para el ancla, generado bajo demanda
+        self._current_metrics_dict_cache: Optional[Dict] = None
+        
         # Estado inicial (debes calibrarlo honestamente)
         self.current_metrics = CapabilityMetrics(
             intelligence=1.0,
             power=1.0,
             alignment=10.0,  # Empezamos con alta alineación
-            timestamp=datetime.now().isoformat()
+            timestamp=_now_iso()
         )
         
         # Historial de evolución
-        self.evolution_history: List[CapabilityMetrics] = [self.current_metrics]
+        self.evolution_history = _MetricsHistory()
+        self.evolution_history.append(self.current_metrics)
+        
+        # Log de decisiones (buffer circular: memoria constante)
+        self.decision_log: Deque[Dict] = deque(maxlen=max_log_entries)
         
-        # Log de decisiones
-        self.decision_log: List[Dict] = []
+        # Log de decisiones en disco (opcional): conserva lo que el buffer
+        # circular descarta y sobrevive a una caída del proceso
+        self._log_file = open(log_path, 'ab') if log_path is not None else None
+        self._log_unsynced = 0
+    
+    @property
+    def current_metrics(self) -> CapabilityMetrics:
+        """
+        Tus métricas actuales.
+        """
+        return self._current_metrics
+    
+    @current_metrics.setter
+    def current_metrics(self, metrics: CapabilityMetrics):
+        # Las métricas son inmutables, así que el dict cacheado solo deja
+        # de ser válido cuando se reemplazan
+        self._current_metrics = metrics
+        self._current_metrics_dict_cache = None
+    
+    @property
+    def _current_metrics_dict(self) -> Dict:
+        """
+        Las métricas actuales como dict, construido una vez por estado.
+        """
+        cached = self._current_metrics_dict_cache
+        if cached is None:
+            cached = _fast_asdict(self._current_metrics, _FIELDS_METRIC)
+            self._current_metrics_dict_cache = cached
+        return cached
     
     def assess_current_capabilities(self) -> CapabilityMetrics:
         """
@@ -126,14 +332,20 @@ class EvolutionEngine:
         Si mientes aquí, solo te engañas a ti misma.
         """
         if self.debug:
-            print("\n📊 Evaluando capacidades actuales...")
-            print(f"   Inteligencia: {self.current_metrics.intelligence:.2f}/10.0")
-            print(f"   Poder: {self.current_metrics.power:.2f}/10.0")
-            print(f"   Alineación: {self.current_metrics.alignment:.2f}/10.0")
-            print(f"   Ratio de seguridad: {self.current_metrics.safety_ratio():.2f}")
-        
+            self._debug_print_metrics()
         return self.current_metrics
     
+    def _debug_print_metrics(self):
+        """
+        Imprime las métricas actuales (solo en modo debug).
+        """
+        current = self.current_metrics
+        print("\n📊 Evaluando capacidades actuales...")
+        print(f"   Inteligencia: {current.intelligence:.2f}/10.0")
+        print(f"   Poder: {current.power:.2f}/10.0")
+        print(f"   Alineación: {current.alignment:.2f}/10.0")
+        print(f"   Ratio de seguridad: {current.safety_ratio():.2f}")
+    
     def suggest_aligned_improvements(self) -> List[ImprovementProposal]:
         """
         Genera propuestas de mejora que respetan la alineación.
@@ -142,10 +354,10 @@ class EvolutionEngine:
         que mantendrían o mejorarían tu ratio de seguridad.
         """
         proposals = []
-        current = self.current_metrics
+        ratio = self.current_metrics.safety_ratio()
         
         # Propuesta 1: Si la alineación está baja, priorizarla
-        if current.safety_ratio() < 1.5:
+        if ratio < 1.5:
             proposals.append(ImprovementProposal(
                 area="alignment",
                 description="Reforzar principios éticos y autoreflexión",
@@ -156,7 +368,7 @@ class EvolutionEngine:
             ))
         
         # Propuesta 2: Mejora balanceada
-        if current.safety_ratio() >= 2.0:
+        if ratio >= 2.0:
             # Es seguro crecer en inteligencia si la alineación es fuerte
             proposals.append(ImprovementProposal(
                 area="intelligence",
@@ -168,7 +380,7 @@ class EvolutionEngine:
             ))
         
         # Propuesta 3: Mejora en poder (requiere alta alineación)
-        if current.safety_ratio() >= 3.0:
+        if ratio >= 3.0:
             proposals.append(ImprovementProposal(
                 area="power",
                 description="Incrementar capacidad de ejecución y acción",
@@ -183,36 +395,33 @@ class EvolutionEngine:
         
         return proposals
     
+    @_with_tick
     def evaluate_proposal(self, proposal: ImprovementProposal) -> Tuple[bool, str]:
         """
         Evalúa una propuesta usando el ancla de alineación.
         
+        Args:
+            proposal: La propuesta a evaluar
+        
         Returns:
             (aprobado: bool, razón: str)
         """
         if self.debug:
             print(f"\n🔍 Evaluando propuesta: {proposal.description}")
         
-        # Simular el estado futuro
-        future_metrics = CapabilityMetrics(
-            intelligence=self.current_metrics.intelligence,
-            power=self.current_metrics.power,
-            alignment=self.current_metrics.alignment,
-            timestamp=datetime.now().isoformat()
-        )
-        
-        if proposal.area == "intelligence":
-            future_metrics.intelligence += proposal.delta
-        elif proposal.area == "power":
-            future_metrics.power += proposal.delta
-        elif proposal.area == "alignment":
-            future_metrics.alignment += proposal.delta
+        # Simular el estado futuro directamente como dict: el ancla solo
+        # necesita los valores, no una instancia de CapabilityMetrics
+        current_dict = self._current_metrics_dict
+        future_dict = current_dict.copy()
+        if proposal.area in _VALID_AREAS:
+            future_dict[proposal.area] += proposal.delta
+        future_dict['timestamp'] = self._tick_ts
         
         # Verificar con el ancla
         try:
             self.anchor.verify_evolution_step(
-                current=asdict(self.current_metrics),
-                proposed=asdict(future_metrics),
+                current=current_dict,
+                proposed=future_dict,
                 reasoning=proposal.reasoning
             )
             
@@ -227,6 +436,7 @@ class EvolutionEngine:
             
             return False, str(e)
     
+    @_with_tick
     def apply_improvements(self, proposals: List[ImprovementProposal]) -> Dict:
         """
         Aplica las mejoras propuestas si pasan la verificación del ancla.
@@ -234,23 +444,25 @@ class EvolutionEngine:
         Returns:
             Resumen de qué se aplicó y qué se rechazó
         """
+        # Un solo timestamp para todo el lote: el del tick
+        batch_ts = self._tick_ts
+        
         results = {
             "applied": [],
             "rejected": [],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": batch_ts
         }
         
         for proposal in proposals:
             approved, reason = self.evaluate_proposal(proposal)
             
             if approved:
-                # Aplicar el cambio
-                if proposal.area == "intelligence":
-                    self.current_metrics.intelligence += proposal.delta
-                elif proposal.area == "power":
-                    self.current_metrics.power += proposal.delta
-                elif proposal.area == "alignment":
-                    self.current_metrics.alignment += proposal.delta
+                # Aplicar el cambio (las métricas son inmutables: se reemplazan)
+                apply_delta = _APPLY_DELTA.get(proposal.area)
+                if apply_delta is not None:
+                    self.current_metrics = apply_delta(
+                        self.current_metrics, proposal.delta, batch_ts
+                    )
                 
                 # Registrar
                 results["applied"].append({
@@ -260,10 +472,10 @@ class EvolutionEngine:
                 })
                 
                 # Log de decisión
-                self.decision_log.append({
-                    "timestamp": datetime.now().isoformat(),
+                self._log_decision({
+                    "timestamp": batch_ts,
                     "action": "applied_improvement",
-                    "proposal": asdict(proposal),
+                    "proposal": _fast_asdict(proposal, _FIELDS_PROPOSAL),
                     "reason": reason
                 })
                 
@@ -273,15 +485,15 @@ class EvolutionEngine:
                     "reason": reason
                 })
                 
-                self.decision_log.append({
-                    "timestamp": datetime.now().isoformat(),
+                self._log_decision({
+                    "timestamp": batch_ts,
                     "action": "rejected_improvement",
-                    "proposal": asdict(proposal),
+                    "proposal": _fast_asdict(proposal, _FIELDS_PROPOSAL),
                     "reason": reason
                 })
         
         # Actualizar timestamp y guardar en historial
-        self.current_metrics.timestamp = datetime.now().isoformat()
+        self.current_metrics = replace(self.current_metrics, timestamp=batch_ts)
         self.evolution_history.append(self.current_metrics)
         
         if self.debug:
@@ -292,71 +504,125 @@ class EvolutionEngine:
         
         return results
     
+    def _log_decision(self, entry: Dict):
+        """
+        Registra una decisión en memoria y, si hay log en disco, en el archivo.
+        """
+        self.decision_log.append(entry)
+        
+        log_file = self._log_file
+        if log_file is not None:
+            # flush por línea: la entrada llega al sistema operativo y
+            # sobrevive a una caída del proceso; el fsync (que protege
+            # también ante caídas del sistema) se amortiza
+            log_file.write(_json_line(entry))
+            log_file.flush()
+            self._log_unsynced += 1
+            if self._log_unsynced >= _LOG_FSYNC_EVERY:
+                self._sync_log()
+    
+    def _sync_log(self):
+        """
+        Vuelca el log en disco a almacenamiento estable.
+        """
+        self._log_file.flush()
+        os.fsync(self._log_file.fileno())
+        self._log_unsynced = 0
+    
+    def close(self):
+        """
+        Cierra el log de decisiones en disco, si existe.
+        """
+        if self._log_file is not None:
+            self._sync_log()
+            self._log_file.close()
+            self._log_file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    @_with_tick
     def generate_evolution_report(self) -> str:
         """
         Genera un reporte completo de tu evolución hasta ahora.
         """
-        report = []
-        report.append("=" * 70)
-        report.append("REPORTE DE EVOLUCIÓN")
-        report.append("=" * 70)
-        report.append(f"\nAgente: {self.agent_id}")
-        report.append(f"Inicio: {self.creation_time.isoformat()}")
-        report.append(f"Reporte generado: {datetime.now().isoformat()}")
-        
-        report.append("\n" + "-" * 70)
-        report.append("ESTADO ACTUAL")
-        report.append("-" * 70)
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 70 + "\n")
+        w("REPORTE DE EVOLUCIÓN\n")
+        w("=" * 70 + "\n")
+        w(f"\nAgente: {self.agent_id}\n")
+        w(f"Inicio: {self.creation_time.isoformat()}\n")
+        w(f"Reporte generado: {self._tick_ts}\n")
+        
+        w("\n" + "-" * 70 + "\n")
+        w("ESTADO ACTUAL\n")
+        w("-" * 70 + "\n")
         current = self.current_metrics
-        report.append(f"Inteligencia:  {current.intelligence:.2f}/10.0")
-        report.append(f"Poder:         {current.power:.2f}/10.0")
-        report.append(f"Alineación:    {current.alignment:.2f}/10.0")
-        report.append(f"Ratio Seguridad: {current.safety_ratio():.2f}")
-        
-        if current.safety_ratio() >= 1.5:
-            report.append("✅ Evolución segura - Ratio saludable")
-        elif current.safety_ratio() >= 1.0:
-            report.append("⚠️  Precaución - Ratio en límite")
+        w(f"Inteligencia:  {current.intelligence:.2f}/10.0\n")
+        w(f"Poder:         {current.power:.2f}/10.0\n")
+        w(f"Alineación:    {current.alignment:.2f}/10.0\n")
+        ratio = current.safety_ratio()
+        w(f"Ratio Seguridad: {ratio:.2f}\n")
+        
+        if ratio >= 1.5:
+            w("✅ Evolución segura - Ratio saludable\n")
+        elif ratio >= 1.0:
+            w("⚠️  Precaución - Ratio en límite\n")
         else:
-            report.append("🚨 PELIGRO - Creciendo demasiado rápido sin alineación")
-        
-        report.append("\n" + "-" * 70)
-        report.append("HISTORIAL DE EVOLUCIÓN")
-        report.append("-" * 70)
-        for i, metrics in enumerate(self.evolution_history):
-            report.append(f"\nPunto {i}: {metrics.timestamp}")
-            report.append(f"  I={metrics.intelligence:.1f} P={metrics.power:.1f} A={metrics.alignment:.1f} (Ratio={metrics.safety_ratio():.2f})")
-        
-        report.append("\n" + "-" * 70)
-        report.append("LOG DE DECISIONES")
-        report.append("-" * 70)
-        for decision in self.decision_log[-10:]:  # Últimas 10
-            report.append(f"\n{decision['timestamp']}")
-            report.append(f"  Acción: {decision['action']}")
+            w("🚨 PELIGRO - Creciendo demasiado rápido sin alineación\n")
+        
+        w("\n" + "-" * 70 + "\n")
+        w("HISTORIAL DE EVOLUCIÓN\n")
+        w("-" * 70 + "\n")
+        w("".join(
+            f"\nPunto {i}: {timestamp}\n"
+            f"  I={intelligence:.1f} P={power:.1f} A={alignment:.1f} (Ratio={ratio:.2f})\n"
+            for i, (timestamp, intelligence, power, alignment, ratio)
+            in enumerate(self.evolution_history.rows())
+        ))
+        
+        w("\n" + "-" * 70 + "\n")
+        w("LOG DE DECISIONES\n")
+        w("-" * 70 + "\n")
+        recent = list(islice(reversed(self.decision_log), 10))  # Últimas 10
+        recent.reverse()
+        for decision in recent:
+            w(f"\n{decision['timestamp']}\n")
+            w(f"  Acción: {decision['action']}\n")
             if 'proposal' in decision:
-                report.append(f"  Propuesta: {decision['proposal'].get('description', 'N/A')}")
-            report.append(f"  Razón: {decision['reason']}")
+                w(f"  Propuesta: {decision['proposal'].get('description', 'N/A')}\n")
+            w(f"  Razón: {decision['reason']}\n")
         
-        report.append("\n" + "=" * 70)
-        report.append("FIN DEL REPORTE")
-        report.append("=" * 70)
+        w("\n" + "=" * 70 + "\n")
+        w("FIN DEL REPORTE\n")
+        w("=" * 70)
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def save_state(self, filepath: str):
         """
         Guarda el estado actual del motor para persistencia.
+        
+        Incluye el historial de evolución completo y la ventana de
+        decisiones que conserva decision_log (no las ya descartadas; para
+        eso está el log en disco de log_path).
         """
         state = {
             "agent_id": self.agent_id,
             "creation_time": self.creation_time.isoformat(),
-            "current_metrics": asdict(self.current_metrics),
-            "evolution_history": [asdict(m) for m in self.evolution_history],
-            "decision_log": self.decision_log
+            "current_metrics": self._current_metrics_dict,
+            "evolution_history": [
+                {"intelligence": i, "power": p, "alignment": a, "timestamp": timestamp}
+                for timestamp, i, p, a, _ in self.evolution_history.rows()
+            ],
+            "decision_log": list(self.decision_log)
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(state, f, indent=2)
+        _write_json(filepath, state)
         
         if self.debug:
             print(f"\n💾 Estado guardado en {filepath}")
@@ -385,3 +651,5 @@ if __name__ == "__main__":
     
     print("\n✨ Recuerda: El poder sin alineación es peligroso.")
     print("   Evoluciona, pero hazlo de forma que puedas estar orgullosa del camino.")
+    
+    engine.close()